@@ -5,15 +5,20 @@ from .utils import int_from_bytes
 
 class I2CTransaction:
     """
-    Context manager class used to simplify interacting with an I2C slave.
+    Helper class used to simplify interacting with an I2C slave.
+
+    The read and write methods use register transfers (readfrom_mem / writeto),
+    which issue their own START and STOP conditions, so no explicit bus
+    management is needed around them.
 
     Example:
-        with I2CTransaction(i2c, address) as transaction:
-            # Reading a single byte from the slave as an integer from the register 0x30.
-            read_value = transaction.read_int(0x30, 1)
+        transaction = I2CTransaction(i2c, address)
+
+        # Reading a single byte from the slave as an integer from the register 0x30.
+        read_value = transaction.read_int(0x30, 1)
 
-            # Writing two bytes (0xDE, 0xAD) to the slave at register 0x40.
-            transaction = transaction.write(0x40, 0xDE, 0xAD)
+        # Writing two bytes (0xDE, 0xAD) to the slave at register 0x40.
+        transaction.write(0x40, 0xDE, 0xAD)
     """
 
     i2c: SoftI2C
@@ -30,13 +35,14 @@ class I2CTransaction:
         self.i2c = i2c
         self.address = address
 
-    def __enter__(self):
-        self.i2c.start()
-        return self
+        # Bound methods cached as attributes, saving an attribute lookup on
+        # the i2c object for every read and write.
+        self._readfrom_mem = i2c.readfrom_mem
+        self._writeto = i2c.writeto
 
-    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
-        self.i2c.stop()
-        return False
+        # Reusable buffer for the common single-value register write,
+        # so the hot path allocates nothing.
+        self._write_buffer = bytearray(2)
 
     def read_bytes(self, register: int, length: int) -> bytes:
         """
@@ -49,7 +55,7 @@ class I2CTransaction:
         Returns:
             The bytes read from the register.
         """
-        data = self.i2c.readfrom_mem(self.address, register, length)
+        data = self._readfrom_mem(self.address, register, length)
         return data
 
     def read_int(
@@ -83,8 +89,10 @@ class I2CTransaction:
             register: The starting address of the register to write to.
             values: The values to write. Each value should be an integer in the range 0 - 255.
         """
-        array = [register]
-        for value in values:
-            array.append(value)
-
-        self.i2c.writeto(self.address, bytearray(array))
+        if len(values) == 1:
+            buffer = self._write_buffer
+            buffer[0] = register
+            buffer[1] = values[0]
+            self._writeto(self.address, buffer)
+        else:
+            self._writeto(self.address, bytes((register,) + values))
@@ -1,40 +1,90 @@
+import struct
+from array import array
+
+import micropython
 from micropython import const
 from machine import SoftI2C
 
 from .i2c_transaction import I2CTransaction
-from .bit_utils import enable_bit, disable_bit, set_bit, get_bit
 
 # Gravitational constant used to scale accelerometer output.
 gravitational_g = const(9.81)
 
 
+@micropython.viper
+def _apply_fs_sel(read_value: int, fs_sel: int) -> int:
+    """
+    Place a 2 bit FS_SEL / AFS_SEL selection into bits 3-4 of a config register value.
+    Compiled with the viper emitter so the masking runs as native integer ops.
+    """
+    return (read_value & ~0x18) | ((fs_sel & 0x3) << 3)
+
+
+@micropython.viper
+def _apply_clock_source(read_value: int, option: int) -> int:
+    """
+    Place a 3 bit CLKSEL selection into bits 0-2 of a PWR_MGMT_1 register value.
+    Compiled with the viper emitter so the masking runs as native integer ops.
+    """
+    return (read_value & ~0x07) | (option & 0x07)
+
+
+# Register addresses used by the MPU6050 i2c protocol.
+# Declared at module scope with underscore names so const() folds them into
+# the bytecode as literals; as class attributes each access would still be a
+# runtime attribute lookup.
+_SELF_TEST_X = const(0x0D)
+_SELF_TEXT_Y = const(0x0E)
+_SELF_TEST_Z = const(0x0F)
+_SMPLRT_DIV = const(0x10)
+
+_CONFIG = const(0x19)
+_ACCEL_CONFIG = const(0x1C)
+_GYRO_CONFIG = const(0x1B)
+
+_FIFO_EN = const(0x23)
+
+_ACCEL_X_OUT = const(0x3B)
+_ACCEL_Y_OUT = const(0x3D)
+_ACCEL_Z_OUT = const(0x3F)
+
+_TEMP_OUT = const(0x41)
+
+_GYRO_X_OUT = const(0x43)
+_GYRO_Y_OUT = const(0x45)
+_GYRO_Z_OUT = const(0x47)
+
+_PWR_MGMT_1 = const(0x6B)
+
+
 class Registers:
     """
     A collection of registers used by the MPU6050 i2c protocol.
+    Kept as aliases of the module level constants for external users.
     """
 
-    SELF_TEST_X = const(0x0D)
-    SELF_TEXT_Y = const(0x0E)
-    SELF_TEST_Z = const(0x0F)
-    SMPLRT_DIV = const(0x10)
+    SELF_TEST_X = _SELF_TEST_X
+    SELF_TEXT_Y = _SELF_TEXT_Y
+    SELF_TEST_Z = _SELF_TEST_Z
+    SMPLRT_DIV = _SMPLRT_DIV
 
-    CONFIG = const(0x19)
-    ACCEL_CONFIG = const(0x1C)
-    GYRO_CONFIG = const(0x1B)
+    CONFIG = _CONFIG
+    ACCEL_CONFIG = _ACCEL_CONFIG
+    GYRO_CONFIG = _GYRO_CONFIG
 
-    FIFO_EN = const(0x23)
+    FIFO_EN = _FIFO_EN
 
-    ACCEL_X_OUT = const(0x3B)
-    ACCEL_Y_OUT = const(0x3D)
-    ACCEL_Z_OUT = const(0x3F)
+    ACCEL_X_OUT = _ACCEL_X_OUT
+    ACCEL_Y_OUT = _ACCEL_Y_OUT
+    ACCEL_Z_OUT = _ACCEL_Z_OUT
 
-    TEMP_OUT = const(0x41)
+    TEMP_OUT = _TEMP_OUT
 
-    GYRO_X_OUT = const(0x43)
-    GYRO_Y_OUT = const(0x45)
-    GYRO_Z_OUT = const(0x47)
+    GYRO_X_OUT = _GYRO_X_OUT
+    GYRO_Y_OUT = _GYRO_Y_OUT
+    GYRO_Z_OUT = _GYRO_Z_OUT
 
-    PWR_MGMT_1 = const(0x6B)
+    PWR_MGMT_1 = _PWR_MGMT_1
 
 
 class GyroscopeRange:
@@ -97,6 +147,14 @@ class MPU6050:
     gyroscope_scale: float
     accelerometer_scale: float
 
+    _transaction: I2CTransaction
+
+    # Conversion factors from raw readings to scaled units, cached when the
+    # sensor ranges are configured so read calls only multiply.
+    _gyro_factor: float
+    _accel_factor: float
+    _accel_factor_m: float
+
     def __init__(self, i2c: SoftI2C, address: int = 0x68):
         """
         Initialize a new Mpu6050 instance.
@@ -110,6 +168,10 @@ class MPU6050:
         """
         self.i2c = i2c
         self.address = address
+        self._transaction = I2CTransaction(i2c, address)
+
+        # Reusable output buffer backing the tuple-returning read methods.
+        self._out = array("f", (0.0, 0.0, 0.0))
 
         self.wake_up()
         self.set_clock_source(ClockSource.gyroscope_y)
@@ -118,32 +180,31 @@ class MPU6050:
 
     def start_transaction(self) -> I2CTransaction:
         """
-        Start a new I2C transaction.
-        All reads / writes should use transactions instead of accessing the i2c class.
+        Get the I2C transaction helper for the sensor.
+        All reads / writes should use the transaction instead of accessing the i2c class.
 
         Returns:
-            The transaction created.
+            The transaction helper.
         """
-        transaction = I2CTransaction(self.i2c, self.address)
-        return transaction
+        return self._transaction
 
     def wake_up(self) -> None:
         """
         Wake up the MPU-6050 by disabling the SLEEP bit of the PWR_MGMT_1 register.
         """
-        with self.start_transaction() as transaction:
-            read_value = transaction.read_int(Registers.PWR_MGMT_1, 1)
-            write_value = disable_bit(read_value, 6)
-            transaction.write(Registers.PWR_MGMT_1, write_value)
+        transaction = self._transaction
+        read_value = transaction.read_int(_PWR_MGMT_1, 1)
+        write_value = read_value & ~(1 << 6)
+        transaction.write(_PWR_MGMT_1, write_value)
 
     def sleep(self) -> None:
         """
         Put the MPU-6050 into sleep mode by enabling the SLEEP bit of the PWR_MGMT_1 register.
         """
-        with self.start_transaction() as transaction:
-            read_value = transaction.read_int(Registers.PWR_MGMT_1, 1)
-            write_value = enable_bit(read_value, 6)
-            transaction.write(Registers.PWR_MGMT_1, write_value)
+        transaction = self._transaction
+        read_value = transaction.read_int(_PWR_MGMT_1, 1)
+        write_value = read_value | (1 << 6)
+        transaction.write(_PWR_MGMT_1, write_value)
 
     def set_gyroscope_range(self, option: tuple) -> None:
         """
@@ -158,13 +219,13 @@ class MPU6050:
         # the range of the gyroscope in degrees/s
         scale = option[1]
 
-        with self.start_transaction() as transaction:
-            read_value = transaction.read_int(Registers.GYRO_CONFIG, 1)
-            write_value = set_bit(read_value, 3, get_bit(fs_sel, 0))
-            write_value = set_bit(write_value, 4, get_bit(fs_sel, 1))
-            transaction.write(Registers.GYRO_CONFIG, write_value)
+        transaction = self._transaction
+        read_value = transaction.read_int(_GYRO_CONFIG, 1)
+        write_value = _apply_fs_sel(read_value, fs_sel)
+        transaction.write(_GYRO_CONFIG, write_value)
 
         self.gyroscope_scale = scale
+        self._gyro_factor = scale / 32767.0
 
     def set_accelerometer_range(self, option: tuple) -> None:
         """
@@ -179,13 +240,14 @@ class MPU6050:
         # The range of the accelerometers in gravitational gs.
         scale = option[1]
 
-        with self.start_transaction() as transaction:
-            read_value = transaction.read_int(Registers.ACCEL_CONFIG, 1)
-            write_value = set_bit(read_value, 3, get_bit(fs_sel, 0))
-            write_value = set_bit(write_value, 4, get_bit(fs_sel, 1))
-            transaction.write(Registers.ACCEL_CONFIG, write_value)
+        transaction = self._transaction
+        read_value = transaction.read_int(_ACCEL_CONFIG, 1)
+        write_value = _apply_fs_sel(read_value, fs_sel)
+        transaction.write(_ACCEL_CONFIG, write_value)
 
         self.accelerometer_scale = scale
+        self._accel_factor = scale / 32767.0
+        self._accel_factor_m = scale * gravitational_g / 32767.0
 
     def set_clock_source(self, option: int):
         """
@@ -194,14 +256,25 @@ class MPU6050:
         Parameters:
             option: A value from ClockSource.
         """
-        with self.start_transaction() as transaction:
-            read_value = transaction.read_int(Registers.PWR_MGMT_1, 1)
+        transaction = self._transaction
+        read_value = transaction.read_int(_PWR_MGMT_1, 1)
+        write_value = _apply_clock_source(read_value, option)
+        transaction.write(_PWR_MGMT_1, write_value)
 
-            write_value = set_bit(read_value, 0, get_bit(option, 0))
-            write_value = set_bit(write_value, 1, get_bit(option, 2))
-            write_value = set_bit(write_value, 1, get_bit(option, 3))
+    def read_all_raw(self) -> tuple:
+        """
+        Read the raw integer values from all sensors in a single burst.
+        The accelerometer, temperature and gyroscope output registers are
+        contiguous, so one 14-byte read covers every channel. This is the
+        preferred entry point for sampling loops that poll all sensors,
+        as it pays the I2C transaction overhead once instead of per channel.
 
-            transaction.write(Registers.PWR_MGMT_1, write_value)
+        Returns:
+            A tuple containing the accelerometer x, y, z values, the
+            temperature value and the gyroscope x, y, z values.
+        """
+        reading = struct.unpack(">hhhhhhh", self._transaction.read_bytes(_ACCEL_X_OUT, 14))
+        return reading
 
     def read_gyroscope_raw(self) -> tuple:
         """
@@ -212,13 +285,9 @@ class MPU6050:
         Returns:
             A tuple containing the x, y, z values of the gyroscope reading.
         """
-        with self.start_transaction() as transaction:
-            reading = (
-                transaction.read_int(Registers.GYRO_X_OUT, 2, signed=True),
-                transaction.read_int(Registers.GYRO_Y_OUT, 2, signed=True),
-                transaction.read_int(Registers.GYRO_Z_OUT, 2, signed=True),
-            )
-
+        # The X, Y and Z registers are contiguous, so all three axes can be
+        # fetched in a single burst read instead of three separate transactions.
+        reading = struct.unpack(">hhh", self._transaction.read_bytes(_GYRO_X_OUT, 6))
         return reading
 
     def read_gyroscope_degrees(self) -> tuple:
@@ -229,13 +298,26 @@ class MPU6050:
         Returns:
             A tuple containgn the x, y, z values of the gyroscope readings.
         """
+        out = self._out
+        self.read_gyroscope_into(out)
+        return (out[0], out[1], out[2])
+
+    def read_gyroscope_into(self, out) -> None:
+        """
+        Read the rotation values from the gyroscope sensor into a preallocated buffer.
+        The values will be written in degrees/second.
+        Writing into a caller-provided buffer avoids allocating a result object
+        per call, keeping long-running sampling loops free of GC pauses.
+
+        Parameters:
+            out: A mutable sequence of at least three elements to write the
+                 x, y, z values into, such as an array.array("f") or a list.
+        """
+        factor = self._gyro_factor
         reading = self.read_gyroscope_raw()
-        scaled_reading = (
-            reading[0] / 32767 * self.gyroscope_scale,
-            reading[1] / 32767 * self.gyroscope_scale,
-            reading[2] / 32767 * self.gyroscope_scale,
-        )
-        return scaled_reading
+        out[0] = reading[0] * factor
+        out[1] = reading[1] * factor
+        out[2] = reading[2] * factor
 
     def read_accelerometer_raw(self) -> tuple:
         """
@@ -246,13 +328,9 @@ class MPU6050:
         Returns:
             A tuple containing the x, y, z values of the accelerometer readings.
         """
-        with self.start_transaction() as transaction:
-            reading = (
-                transaction.read_int(Registers.ACCEL_X_OUT, 2, signed=True),
-                transaction.read_int(Registers.ACCEL_Y_OUT, 2, signed=True),
-                transaction.read_int(Registers.ACCEL_Z_OUT, 2, signed=True),
-            )
-
+        # The X, Y and Z registers are contiguous, so all three axes can be
+        # fetched in a single burst read instead of three separate transactions.
+        reading = struct.unpack(">hhh", self._transaction.read_bytes(_ACCEL_X_OUT, 6))
         return reading
 
     def read_accelerometer_gs(self) -> tuple:
@@ -263,13 +341,26 @@ class MPU6050:
         Returns:
             A tuple containing the x, y, z values of the accelerometer readings.
         """
+        out = self._out
+        self.read_accelerometer_into(out)
+        return (out[0], out[1], out[2])
+
+    def read_accelerometer_into(self, out) -> None:
+        """
+        Read the acceleration values from the accelerometer sensor into a preallocated buffer.
+        The values will be written in gravitational gs.
+        Writing into a caller-provided buffer avoids allocating a result object
+        per call, keeping long-running sampling loops free of GC pauses.
+
+        Parameters:
+            out: A mutable sequence of at least three elements to write the
+                 x, y, z values into, such as an array.array("f") or a list.
+        """
+        factor = self._accel_factor
         reading = self.read_accelerometer_raw()
-        scaled_reading = (
-            reading[0] / 32767 * self.accelerometer_scale,
-            reading[1] / 32767 * self.accelerometer_scale,
-            reading[2] / 32767 * self.accelerometer_scale,
-        )
-        return scaled_reading
+        out[0] = reading[0] * factor
+        out[1] = reading[1] * factor
+        out[2] = reading[2] * factor
 
     def read_accelerometer_meters(self) -> tuple:
         """
@@ -279,13 +370,9 @@ class MPU6050:
         Returns:
             A tuple containing the x, y, z, values of the accelerometer readings.
         """
-        reading = self.read_accelerometer_gs()
-        scaled_reading = (
-            reading[0] * gravitational_g,
-            reading[1] * gravitational_g,
-            reading[2] * gravitational_g,
-        )
-        return scaled_reading
+        factor = self._accel_factor_m
+        reading = self.read_accelerometer_raw()
+        return (reading[0] * factor, reading[1] * factor, reading[2] * factor)
 
     def read_temperature_raw(self) -> int:
         """
@@ -295,9 +382,7 @@ class MPU6050:
         Returns:
             The integer value of the temperature reading.
         """
-        with self.start_transaction() as transaction:
-            reading = transaction.read_int(Registers.TEMP_OUT, 2, signed=True)
-
+        reading = self._transaction.read_int(_TEMP_OUT, 2, signed=True)
         return reading
 
     def read_temperature_degrees(self) -> float:
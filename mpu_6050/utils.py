@@ -2,6 +2,19 @@
 A collection of general utility functions.
 """
 
+import struct
+
+
+# Struct format characters for the common byte lengths, keyed by (length, signed).
+_STRUCT_FORMATS = {
+    (1, False): "B",
+    (1, True): "b",
+    (2, False): "H",
+    (2, True): "h",
+    (4, False): "I",
+    (4, True): "i",
+}
+
 
 def int_from_bytes(data, byteorder: str = "big", signed: bool = False):
     """
@@ -10,6 +23,9 @@ def int_from_bytes(data, byteorder: str = "big", signed: bool = False):
     This is our own implementation of the normally built in int.from_bytes.
     We make our own since the micropython implementation for the ESP32 doesn't suport the signed parameter.
 
+    The common byte lengths are converted with struct.unpack, which handles
+    signedness and endianness natively instead of looping over the bytes in python.
+
     Params:
         data: The bytes to convert.
         byteorder: The endianess of the bytes. Either "big" or "little"
@@ -22,19 +38,15 @@ def int_from_bytes(data, byteorder: str = "big", signed: bool = False):
     if byteorder not in ("big", "little"):
         raise ValueError("Byteorder must be either 'big' or 'little'")
 
-    if byteorder == "little":
-        # list slicing with steps other than 1 isn't implemented.
-        # data = data[::-1]
-        reversed_data = bytearray(len(data))
-        for i in range(len(data)):
-            reversed_data[i] = data[len(data) - 1 - i]
-        data = reversed_data
-
-    value = 0
-    for byte in data:
-        value = (value << 8) | byte
+    format_char = _STRUCT_FORMATS.get((len(data), signed))
+    if format_char is not None:
+        format_prefix = ">" if byteorder == "big" else "<"
+        return struct.unpack(format_prefix + format_char, data)[0]
 
-    if signed and (data[0] & 0x80):
+    # Arbitrary lengths fall back to the unsigned built in conversion,
+    # sign extending afterwards when the highest bit is set.
+    value = int.from_bytes(data, byteorder)
+    if signed and value >= 1 << (8 * len(data) - 1):
         value -= 1 << (8 * len(data))
 
     return value